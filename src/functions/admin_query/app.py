@@ -27,6 +27,7 @@ from __future__ import annotations
 
 import datetime
 import decimal
+import functools
 import math
 import os
 import uuid
@@ -42,6 +43,10 @@ _DEFAULT_MAX_ROWS = 200
 _HARD_MAX_ROWS = 1000
 _DEFAULT_STATEMENT_TIMEOUT_MS = 30_000
 
+# Audit-log at most this much of the statement; a generated multi-megabyte
+# VALUES list should not be serialized into every log record.
+_LOGGED_SQL_MAX_CHARS = 2_000
+
 # Statements whose results can be streamed via a server-side cursor (DECLARE
 # CURSOR accepts only these). Utility statements (SHOW / EXPLAIN) return small
 # results and go through a client cursor instead.
@@ -77,8 +82,13 @@ def _jsonable(value: Any) -> Any:
     return str(value)
 
 
+@functools.lru_cache(maxsize=1)
 def _statement_timeout_ms() -> int:
-    """Server-side per-statement timeout (ms); overridable via env, floored at 1s."""
+    """Server-side per-statement timeout (ms); overridable via env, floored at 1s.
+
+    Cached: Lambda env vars are fixed for the life of the execution
+    environment, so the parse doesn't need to re-run per invocation.
+    """
     try:
         return max(
             1_000, int(os.environ.get("ADMIN_QUERY_TIMEOUT_MS", _DEFAULT_STATEMENT_TIMEOUT_MS))
@@ -103,7 +113,22 @@ def _collect(cur: Any, max_rows: int) -> tuple[list[str], list[list[Any]], bool]
     columns = [col.name for col in cur.description]
     fetched = cur.fetchmany(max_rows + 1)
     truncated = len(fetched) > max_rows
-    rows = [[_jsonable(v) for v in record] for record in fetched[:max_rows]]
+    window = fetched[:max_rows]
+
+    # A cursor column maps to a single Postgres type, so decide per column
+    # (from its first non-None value) whether values pass through untouched;
+    # bool/int/str columns -- the common case -- then skip the per-cell
+    # isinstance ladder in _jsonable. None counts as passthrough either way.
+    passthrough = [
+        (first := next((record[idx] for record in window if record[idx] is not None), None))
+        is None
+        or isinstance(first, (bool, int, str))
+        for idx in range(len(columns))
+    ]
+    rows = [
+        [value if passthrough[idx] else _jsonable(value) for idx, value in enumerate(record)]
+        for record in window
+    ]
     return columns, rows, truncated
 
 
@@ -128,7 +153,15 @@ def handler(event: dict[str, Any], context: LambdaContext) -> dict[str, Any]:
     conn.rollback()
     conn.read_only = not write
 
-    logger.info("admin-query", extra={"write": write, "max_rows": max_rows, "sql": sql})
+    logger.info(
+        "admin-query",
+        extra={
+            "write": write,
+            "max_rows": max_rows,
+            "sql": sql[:_LOGGED_SQL_MAX_CHARS],
+            "sql_chars": len(sql),
+        },
+    )
 
     columns: list[str] = []
     rows: list[list[Any]] = []
@@ -7,12 +7,12 @@ no network or DB access.
 
 from __future__ import annotations
 
+from itertools import chain
 from typing import Any
 
 from aws_lambda_powertools import Logger, Tracer
 
 from bdo_common.arsha_client import normalize_response
-from bdo_common.models import Record
 
 logger = Logger()
 tracer = Tracer()
@@ -22,11 +22,14 @@ tracer = Tracer()
 @logger.inject_lambda_context
 def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     """Return ``{region, snapshot_at, items, records}`` with ``raw`` dropped."""
-    records: list[Record] = []
-    for payload in event.get("raw", []):
-        records.extend(normalize_response(payload))
-
-    record_dicts = [r.model_dump(mode="json") for r in records]
+    # Flatten and dump in one pass: the Record list is transient here, and this
+    # state can carry thousands of records, so skip the intermediate list.
+    record_dicts = [
+        record.model_dump(mode="json")
+        for record in chain.from_iterable(
+            normalize_response(payload) for payload in event.get("raw", [])
+        )
+    ]
     logger.info("cleanData complete", extra={"record_count": len(record_dicts)})
     return {
         "region": event["region"],
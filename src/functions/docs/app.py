@@ -18,6 +18,7 @@ not part of the shared bdo-common layer (ADR-0003).
 from __future__ import annotations
 
 import functools
+import json
 from pathlib import Path
 from typing import Any
 
@@ -72,6 +73,19 @@ def _load_spec() -> dict[str, Any]:
     return spec
 
 
+@functools.lru_cache(maxsize=8)
+def _spec_json(base_url: str) -> str:
+    """Render the spec to JSON once per base URL (the only per-request part).
+
+    The document is static apart from ``servers``, so re-encoding the whole
+    spec on every request is wasted CPU on the warm path; behind a single stage
+    or custom domain this is one entry.
+    """
+    spec = dict(_load_spec())
+    spec["servers"] = [{"url": base_url}]
+    return json.dumps(spec, separators=(",", ":"))
+
+
 def _base_url() -> str:
     """Reconstruct the request's base URL (the prefix in front of ``/v1``).
 
@@ -89,11 +103,13 @@ def _base_url() -> str:
 
 
 @app.get(_OPENAPI_ROUTE)
-def openapi_json() -> dict[str, Any]:
+def openapi_json() -> Response[str]:
     """Return the OpenAPI document with ``servers`` set to the live base URL."""
-    spec = dict(_load_spec())
-    spec["servers"] = [{"url": _base_url() or "/"}]
-    return spec
+    return Response(
+        status_code=200,
+        content_type=content_types.APPLICATION_JSON,
+        body=_spec_json(_base_url() or "/"),
+    )
 
 
 @app.get("/v1/docs")
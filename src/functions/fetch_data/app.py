@@ -17,6 +17,16 @@ from bdo_common.arsha_client import ArshaClient
 logger = Logger()
 tracer = Tracer()
 
+#: Warm-start reuse: one stateless client per region per execution environment.
+_clients: dict[str, ArshaClient] = {}
+
+
+def _get_client(region: str) -> ArshaClient:
+    client = _clients.get(region)
+    if client is None:
+        client = _clients[region] = ArshaClient(region=region)
+    return client
+
 
 @tracer.capture_lambda_handler
 @logger.inject_lambda_context
@@ -26,8 +36,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
     items = event["items"]
     item_ids = [int(item["id"]) for item in items]
 
-    client = ArshaClient(region=region)
-    raw = client.fetch_raw(item_ids)
+    raw = _get_client(region).fetch_raw(item_ids)
 
     logger.info(
         "fetchData complete",
@@ -16,25 +16,29 @@ rather than Powertools' default 422.
 from __future__ import annotations
 
 import json
+import time
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import date, datetime
-from typing import Annotated, Any, Literal
+from typing import TYPE_CHECKING, Annotated, Any, Literal
 
-import psycopg
 from aws_lambda_powertools import Logger, Metrics, Tracer
 from aws_lambda_powertools.event_handler import APIGatewayRestResolver, Response, content_types
 from aws_lambda_powertools.event_handler.openapi.exceptions import RequestValidationError
 from aws_lambda_powertools.event_handler.openapi.params import Query
 from aws_lambda_powertools.metrics import MetricUnit
 from aws_lambda_powertools.utilities.typing import LambdaContext
+from pydantic import TypeAdapter
 
 from bdo_common import analytics, db, pricing
 from bdo_common.insights.models import Period
 from bdo_common.insights.repositories import SummaryRepo
-from bdo_common.models import SnapshotRow
+from bdo_common.models import DailyRow, SnapshotRow
 from bdo_common.repositories import DailyRepo, SnapshotRepo
 
+if TYPE_CHECKING:
+    import psycopg
+
 logger = Logger()
 tracer = Tracer()
 metrics = Metrics(namespace="BdoMarket")
@@ -43,6 +47,24 @@ app = APIGatewayRestResolver(enable_validation=True)
 #: FR-13 hard cap on snapshots returned per request.
 MAX_SNAPSHOT_LIMIT = 1000
 
+#: Built once so list serialization runs inside pydantic-core instead of a
+#: Python-level ``model_dump`` call per row (these routes return up to 1000).
+_SNAPSHOT_LIST = TypeAdapter(list[SnapshotRow])
+_DAILY_LIST = TypeAdapter(list[DailyRow])
+
+#: Warm-environment memo of rendered /v1/insights bodies for explicit-date
+#: requests (latest-available requests always hit the DB). Keyed by
+#: (region, period, date, lang); bounded and TTL'd since a same-day summary
+#: can be re-upserted by the insights job.
+_INSIGHTS_TTL_SECONDS = 300
+_INSIGHTS_CACHE_MAX = 128
+_insights_cache: dict[tuple[str, str, str, str], tuple[float, str]] = {}
+
+#: The /v1/insights miss body is constant; encode it once, not per 404.
+_INSIGHTS_NOT_FOUND_BODY = json.dumps(
+    {"statusCode": 404, "message": "No summary found"}, separators=(",", ":")
+)
+
 #: Valid BDO server regions. Mirrors the ``BdoRegion`` AllowedValues enum in
 #: ``template.yaml`` (the IaC source); an unknown region is rejected with 400.
 Region = Literal[
@@ -78,7 +100,8 @@ def handle_validation_error(exc: RequestValidationError) -> Response[str]:
         status_code=400,
         content_type=content_types.APPLICATION_JSON,
         body=json.dumps(
-            {"statusCode": 400, "message": "Invalid request parameters", "detail": detail}
+            {"statusCode": 400, "message": "Invalid request parameters", "detail": detail},
+            separators=(",", ":"),
         ),
     )
 
@@ -98,15 +121,6 @@ def _reading() -> Iterator[psycopg.Connection[tuple[Any, ...]]]:
         conn.rollback()
 
 
-def _latest_price_by_sid(rows: list[SnapshotRow]) -> dict[int, float]:
-    """Build a ``{sid: base_price}`` ladder from snapshots (newest-first input)."""
-    prices: dict[int, float] = {}
-    for row in rows:
-        if row.sid not in prices:
-            prices[row.sid] = float(row.base_price)
-    return prices
-
-
 @app.get("/v1/market/items/<item_id>/snapshots")
 def get_snapshots(
     item_id: int,
@@ -157,7 +171,7 @@ def get_snapshots(
         "region": region,
         "sid": sid,
         "count": len(rows),
-        "snapshots": [row.model_dump(mode="json") for row in rows],
+        "snapshots": _SNAPSHOT_LIST.dump_python(rows, mode="json"),
     }
 
 
@@ -203,7 +217,7 @@ def get_daily(
         "region": region,
         "sid": sid,
         "count": len(rows),
-        "daily": [row.model_dump(mode="json") for row in rows],
+        "daily": _DAILY_LIST.dump_python(rows, mode="json"),
     }
 
 
@@ -238,14 +252,12 @@ def get_analysis(
     sid_val = sid if sid is not None else 0
 
     with _reading() as conn:
-        ladder_rows = SnapshotRepo.get_snapshots(
-            conn, region=region, item_id=item_id, limit=MAX_SNAPSHOT_LIMIT
-        )
+        ladder = SnapshotRepo.latest_prices_by_sid(conn, region=region, item_id=item_id)
         window = DailyRepo.get_daily_window(
             conn, region=region, item_id=item_id, sid=sid_val, window_days=window_days
         )
 
-    prices = _latest_price_by_sid(ladder_rows)
+    prices = {sid_key: float(price) for sid_key, price in ladder.items()}
     enhancement = (
         pricing.enhancement_analysis(prices, model_id="accessory_v1", intent="personal")
         if prices
@@ -254,8 +266,11 @@ def get_analysis(
 
     # get_daily_window returns newest-first; analytics expects chronological so
     # that the latest close is the last element for the z-score.
-    closes = [float(row.close_price) for row in reversed(window)]
-    volumes = [float(row.total_trades_delta) for row in reversed(window)]
+    closes: list[float] = []
+    volumes: list[float] = []
+    for row in reversed(window):
+        closes.append(float(row.close_price))
+        volumes.append(float(row.total_trades_delta))
     market = analytics.market_analytics(closes, volumes, window_days=window_days)
 
     if not market.get("insufficient_data") and market["anomaly"]["is_anomalous"]:
@@ -295,6 +310,18 @@ def get_insights(
     lang: Annotated[str, Query(description="Narrative language code. Default: en.")] = "en",
 ) -> Response[str]:
     """Market insights summary (digest + narrative)."""
+    cache_key: tuple[str, str, str, str] | None = None
+    if date_ is not None:
+        # Explicit-date summaries change only when the insights job re-upserts
+        # them, so repeat requests inside the TTL skip the RDS round-trip and
+        # the digest/narrative re-serialization entirely.
+        cache_key = (region, period, date_.isoformat(), lang)
+        cached = _insights_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _INSIGHTS_TTL_SECONDS:
+            return Response(
+                status_code=200, content_type=content_types.APPLICATION_JSON, body=cached[1]
+            )
+
     with _reading() as conn:
         summary = SummaryRepo.get(
             conn, region=region, period=period, summary_date=date_, lang=lang
@@ -303,23 +330,26 @@ def get_insights(
         return Response(
             status_code=404,
             content_type=content_types.APPLICATION_JSON,
-            body=json.dumps({"statusCode": 404, "message": "No summary found"}),
+            body=_INSIGHTS_NOT_FOUND_BODY,
         )
-    return Response(
-        status_code=200,
-        content_type=content_types.APPLICATION_JSON,
-        body=json.dumps(
-            {
-                "region": summary.region,
-                "period": summary.period,
-                "summary_date": summary.summary_date.isoformat(),
-                "lang": summary.lang,
-                "model_id": summary.model_id,
-                "digest": summary.digest.model_dump(mode="json"),
-                "narrative": summary.narrative.model_dump(mode="json"),
-            }
-        ),
+    body = json.dumps(
+        {
+            "region": summary.region,
+            "period": summary.period,
+            "summary_date": summary.summary_date.isoformat(),
+            "lang": summary.lang,
+            "model_id": summary.model_id,
+            "digest": summary.digest.model_dump(mode="json"),
+            "narrative": summary.narrative.model_dump(mode="json"),
+        },
+        separators=(",", ":"),
     )
+    if cache_key is not None:
+        if len(_insights_cache) >= _INSIGHTS_CACHE_MAX:
+            # Evict the oldest insertion; a plain dict keeps that order.
+            _insights_cache.pop(next(iter(_insights_cache)))
+        _insights_cache[cache_key] = (time.monotonic(), body)
+    return Response(status_code=200, content_type=content_types.APPLICATION_JSON, body=body)
 
 
 @logger.inject_lambda_context
@@ -38,16 +38,21 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
 
     conn = db.get_connection()
     try:
-        for item in items:
-            ItemRepo.upsert(
-                conn,
-                item_id=int(item["id"]),
-                name=item["name"],
-                category=item.get("category"),
-                main_category=item.get("main_category"),
-                sub_category=item.get("sub_category"),
-            )
+        ItemRepo.bulk_upsert(
+            conn,
+            [
+                (
+                    int(item["id"]),
+                    item["name"],
+                    item.get("category"),
+                    item.get("main_category"),
+                    item.get("sub_category"),
+                )
+                for item in items
+            ],
+        )
 
+        sid_rows: list[tuple[str, int, int, int, int, int]] = []
         snapshots: list[SnapshotRow] = []
         skipped = 0
         for rec in records:
@@ -56,14 +61,8 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                 # violate the item_sid FK; skip rather than poison the batch.
                 skipped += 1
                 continue
-            ItemSidRepo.upsert(
-                conn,
-                region=region,
-                item_id=rec.item_id,
-                sid=rec.sid,
-                max_enhance=rec.max_enhance,
-                price_min=rec.price_min,
-                price_max=rec.price_max,
+            sid_rows.append(
+                (region, rec.item_id, rec.sid, rec.max_enhance, rec.price_min, rec.price_max)
             )
             snapshots.append(
                 SnapshotRow(
@@ -79,6 +78,7 @@ def handler(event: dict[str, Any], context: Any) -> dict[str, Any]:
                 )
             )
 
+        ItemSidRepo.bulk_upsert(conn, sid_rows)
         snapshot_count = SnapshotRepo.bulk_insert(conn, snapshots)
         conn.commit()
     except Exception:
@@ -8,6 +8,7 @@ import time
 import urllib.error
 import urllib.request
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import Any
 
@@ -17,6 +18,15 @@ logger = logging.getLogger(__name__)
 
 _MAX_BATCH_SIZE = 50
 
+#: Concurrent GetWorldMarketSubList requests per fetch_raw call. Batches are
+#: I/O-bound (threads release the GIL around the socket), so a small pool
+#: overlaps the per-request RTTs without hammering arsha.io.
+_FETCH_MAX_WORKERS = 8
+
+#: Shared across invocations (warm Lambda): threads are spawned lazily and
+#: reused, so repeat ETL ticks skip per-call pool setup/teardown.
+_fetch_executor = ThreadPoolExecutor(max_workers=_FETCH_MAX_WORKERS)
+
 #: ``util/db`` is a low-traffic, uncached endpoint that intermittently returns
 #: HTTP 500 or times out; transient failures are retried with linear backoff.
 _UTIL_DB_MAX_ATTEMPTS = 4
@@ -36,10 +46,6 @@ def _is_retryable_fetch_error(exc: Exception) -> bool:
 
 _MAX_URL_LENGTH = 1900
 
-# arsha.io item dicts are identified by the presence of these keys. Anything
-# else encountered while flattening (empty dicts, error envelopes) is ignored.
-_IDENTITY_KEYS = ("id", "sid")
-
 #: arsha.io ``lang`` query-param codes -> human-readable label. Used by the
 #: item-catalog sync (``util/db?lang=``) and any language-aware request. The
 #: ``grade`` returned by ``util/db`` is language-independent; ``lang`` only
@@ -64,6 +70,38 @@ SUPPORTED_LANGS: dict[str, str] = {
 DEFAULT_LANG = "en"
 
 
+def _fetch_json_with_retry(url: str, *, label: str) -> Any | None:
+    """GET ``url`` and parse JSON, retrying transient failures with backoff.
+
+    Shared by the uncached ``util/db`` and ``GetWorldMarketList`` endpoints.
+    Returns the parsed payload, or ``None`` when the final (or a
+    non-retryable) attempt failed; the error is logged under ``label``.
+    """
+    for attempt in range(1, _UTIL_DB_MAX_ATTEMPTS + 1):
+        try:
+            # URL is built internally and is always https://api.arsha.io/...
+            with urllib.request.urlopen(  # noqa: S310  # nosec B310
+                url, timeout=_UTIL_DB_TIMEOUT_SECONDS
+            ) as resp:
+                return json.loads(resp.read())
+        except Exception as exc:
+            if not _is_retryable_fetch_error(exc) or attempt == _UTIL_DB_MAX_ATTEMPTS:
+                logger.error(
+                    "%s fetch failed for %s after %d attempt(s): %s", label, url, attempt, exc
+                )
+                return None
+            logger.warning(
+                "%s fetch attempt %d/%d failed for %s: %s; retrying",
+                label,
+                attempt,
+                _UTIL_DB_MAX_ATTEMPTS,
+                url,
+                exc,
+            )
+            time.sleep(_UTIL_DB_BACKOFF_SECONDS * attempt)
+    return None  # unreachable: the loop returns on success or final failure
+
+
 def _iter_item_dicts(node: Any) -> Iterator[dict[str, Any]]:
     """Recursively yield item dicts from arsha's polymorphic JSON.
 
@@ -82,7 +120,12 @@ def _iter_item_dicts(node: Any) -> Iterator[dict[str, Any]]:
         yield node
     elif isinstance(node, list):
         for element in node:
-            yield from _iter_item_dicts(element)
+            # Dicts are by far the common list element; yielding them here
+            # skips a generator frame per item row.
+            if isinstance(element, dict):
+                yield element
+            else:
+                yield from _iter_item_dicts(element)
 
 
 def _parse_record(obj: dict[str, Any]) -> Record | None:
@@ -92,7 +135,9 @@ def _parse_record(obj: dict[str, Any]) -> Record | None:
     not item rows and return None silently. Item rows that are present but
     malformed are skipped with a warning.
     """
-    if not all(key in obj for key in _IDENTITY_KEYS):
+    # Item dicts are identified by the id/sid pair; anything else encountered
+    # while flattening (empty dicts, error envelopes) is ignored.
+    if "id" not in obj or "sid" not in obj:
         return None
     try:
         return Record(
@@ -238,28 +283,35 @@ class ArshaClient:
             batches.extend(self._split_batch_by_url_length(chunk))
         return batches
 
+    def _fetch_batch(self, batch: list[int]) -> Any | None:
+        """Fetch one batch; returns the parsed payload or None on failure."""
+        url = self._build_url(batch)
+        try:
+            # URL is built internally and is always https://api.arsha.io/...
+            with urllib.request.urlopen(url, timeout=10) as resp:  # noqa: S310  # nosec B310
+                return json.loads(resp.read())
+        except Exception:
+            logger.exception("Failed to fetch batch from %s", url)
+            return None
+
     def fetch_raw(self, item_ids: list[int]) -> list[Any]:
         """Fetch raw arsha.io JSON payloads (one per HTTP request), unparsed.
 
         Batches into groups of <= 50 IDs, further splitting if the URL
-        exceeds 1900 characters. Network errors are logged and skipped.
-        Used by the ETL ``fetchData`` Lambda so that parsing happens in a
-        separate ``cleanData`` stage (retries never re-hit the network).
+        exceeds 1900 characters; batches are fetched concurrently (bounded
+        pool) and payloads keep batch order. Network errors are logged and
+        skipped. Used by the ETL ``fetchData`` Lambda so that parsing happens
+        in a separate ``cleanData`` stage (retries never re-hit the network).
         """
         if not item_ids:
             return []
 
-        payloads: list[Any] = []
-        for batch in self._plan_batches(item_ids):
-            url = self._build_url(batch)
-            try:
-                # URL is built internally and is always https://api.arsha.io/...
-                with urllib.request.urlopen(url, timeout=10) as resp:  # noqa: S310  # nosec B310
-                    payloads.append(json.loads(resp.read().decode()))
-            except Exception:
-                logger.exception("Failed to fetch batch from %s", url)
-                continue
-        return payloads
+        batches = self._plan_batches(item_ids)
+        if len(batches) == 1:
+            payloads = [self._fetch_batch(batches[0])]
+        else:
+            payloads = list(_fetch_executor.map(self._fetch_batch, batches))
+        return [payload for payload in payloads if payload is not None]
 
     def fetch_sub_list(self, item_ids: list[int]) -> list[Record]:
         """Fetch and normalize market data for the given item IDs.
@@ -289,30 +341,8 @@ class ArshaClient:
             supported = ", ".join(sorted(SUPPORTED_LANGS))
             msg = f"unsupported lang {lang!r}; expected one of: {supported}"
             raise ValueError(msg)
-        url = self._build_item_db_url(lang)
-        for attempt in range(1, _UTIL_DB_MAX_ATTEMPTS + 1):
-            try:
-                # URL is built internally and is always https://api.arsha.io/...
-                with urllib.request.urlopen(  # noqa: S310  # nosec B310
-                    url, timeout=_UTIL_DB_TIMEOUT_SECONDS
-                ) as resp:
-                    raw = json.loads(resp.read().decode())
-                return normalize_item_db(raw)
-            except Exception as exc:
-                if not _is_retryable_fetch_error(exc) or attempt == _UTIL_DB_MAX_ATTEMPTS:
-                    logger.error(
-                        "util/db fetch failed for %s after %d attempt(s): %s", url, attempt, exc
-                    )
-                    return []
-                logger.warning(
-                    "util/db fetch attempt %d/%d failed for %s: %s; retrying",
-                    attempt,
-                    _UTIL_DB_MAX_ATTEMPTS,
-                    url,
-                    exc,
-                )
-                time.sleep(_UTIL_DB_BACKOFF_SECONDS * attempt)
-        return []  # unreachable: the loop returns on success or final failure
+        raw = _fetch_json_with_retry(self._build_item_db_url(lang), label="util/db")
+        return normalize_item_db(raw) if raw is not None else []
 
     def _build_market_list_url(self, main_category: int, sub_category: int) -> str:
         """Build the GetWorldMarketList URL for one market (main, sub) category."""
@@ -332,29 +362,5 @@ class ArshaClient:
         list is returned (the caller reports the affected items as unclassified).
         """
         url = self._build_market_list_url(main_category, sub_category)
-        for attempt in range(1, _UTIL_DB_MAX_ATTEMPTS + 1):
-            try:
-                # URL is built internally and is always https://api.arsha.io/...
-                with urllib.request.urlopen(  # noqa: S310  # nosec B310
-                    url, timeout=_UTIL_DB_TIMEOUT_SECONDS
-                ) as resp:
-                    raw = json.loads(resp.read().decode())
-                return normalize_market_list(raw)
-            except Exception as exc:
-                if not _is_retryable_fetch_error(exc) or attempt == _UTIL_DB_MAX_ATTEMPTS:
-                    logger.error(
-                        "GetWorldMarketList fetch failed for %s after %d attempt(s): %s",
-                        url,
-                        attempt,
-                        exc,
-                    )
-                    return []
-                logger.warning(
-                    "GetWorldMarketList attempt %d/%d failed for %s: %s; retrying",
-                    attempt,
-                    _UTIL_DB_MAX_ATTEMPTS,
-                    url,
-                    exc,
-                )
-                time.sleep(_UTIL_DB_BACKOFF_SECONDS * attempt)
-        return []  # unreachable: the loop returns on success or final failure
+        raw = _fetch_json_with_retry(url, label="GetWorldMarketList")
+        return normalize_market_list(raw) if raw is not None else []
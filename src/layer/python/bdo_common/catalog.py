@@ -10,12 +10,10 @@ from __future__ import annotations
 
 import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 
-import boto3
-from botocore.exceptions import ClientError
-
 from bdo_common import dynamo
 from bdo_common.arsha_client import DEFAULT_LANG, ArshaClient
 from bdo_common.models import CatalogEntry, MergedCatalogItem
@@ -82,6 +80,8 @@ def diff_catalog(
 
 def _read_checksum(param: str, ssm_client: Any) -> str | None:
     """Read the stored catalog checksum from SSM, or None if it doesn't exist."""
+    from botocore.exceptions import ClientError  # deferred: only needed with SSM
+
     try:
         value: str = ssm_client.get_parameter(Name=param)["Parameter"]["Value"]
     except ClientError as exc:
@@ -161,7 +161,11 @@ def sync_catalog(
     A failed/empty fetch yields no items for that language, so the sync is
     strictly additive and never deletes.
     """
-    by_lang = {lang: client.fetch_item_db(lang) for lang in langs}
+    # Per-language fetches are independent downloads; overlap them so the
+    # fetch phase costs roughly the slowest language instead of their sum.
+    # executor.map preserves input order, keeping the merge deterministic.
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(langs)))) as executor:
+        by_lang = dict(zip(langs, executor.map(client.fetch_item_db, langs), strict=True))
     fetched = {lang: len(entries) for lang, entries in by_lang.items()}
 
     # The default language supplies the canonical (English) name. If it failed
@@ -190,7 +194,11 @@ def sync_catalog(
 
     ssm: Any = None
     if checksum_param is not None and complete_fetch:
-        ssm = ssm_client if ssm_client is not None else boto3.client("ssm")
+        if ssm_client is None:
+            import boto3  # imported here to avoid cold-start cost for non-SSM callers
+
+            ssm_client = boto3.client("ssm")
+        ssm = ssm_client
         if _read_checksum(checksum_param, ssm) == checksum:
             logger.info("catalog sync: checksum unchanged, skipping writes")
             return CatalogSyncStats(
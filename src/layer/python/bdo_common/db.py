@@ -1,16 +1,24 @@
-"""psycopg3 module-global connection helper with IAM database authentication."""
+"""psycopg3 module-global connection helper with IAM database authentication.
+
+Deliberately a single connection, not a client-side pool: a Lambda execution
+environment handles one invocation at a time, so a pool here would only hold
+idle sockets against RDS. Pooling across environments is delegated to the
+opt-in RDS Proxy (ADR-0002); this module's job is warm-start reuse plus the
+IAM-token TTL reconnect below.
+"""
 
 from __future__ import annotations
 
 import logging
 import os
 import time
-from typing import Any
-
-import psycopg
+from typing import TYPE_CHECKING, Any
 
 from bdo_common.config import get_settings
 
+if TYPE_CHECKING:
+    import psycopg
+
 logger = logging.getLogger(__name__)
 
 _connection: psycopg.Connection[tuple[Any, ...]] | None = None
@@ -50,6 +58,10 @@ def get_connection() -> psycopg.Connection[tuple[Any, ...]]:
     auth token has exceeded its TTL (12 minutes).
     Supports IAM database authentication when USE_IAM_AUTH=true.
     """
+    # Deferred: loading the psycopg C extension is cold-start cost that
+    # DynamoDB-only Lambdas importing this layer should never pay.
+    import psycopg
+
     global _connection, _connection_created_at  # noqa: PLW0603
 
     settings = get_settings()
@@ -81,9 +93,22 @@ def get_connection() -> psycopg.Connection[tuple[Any, ...]]:
         user=user,
         password=password,
         sslmode="require" if use_iam else "prefer",
+        # Keep the socket alive across Lambda freeze/thaw idle gaps so a warm
+        # invocation doesn't inherit a connection an intermediate NAT silently
+        # dropped, and bound how long an unreachable host can stall connect.
+        connect_timeout=10,
+        keepalives=1,
+        keepalives_idle=30,
+        keepalives_interval=10,
+        keepalives_count=5,
     )
 
     _connection = psycopg.connect(conninfo, autocommit=False)
+    # Repository queries are a small fixed set re-run on every warm
+    # invocation; prepare server-side from the first execution so Postgres
+    # reuses the parsed plan instead of re-planning per request (the psycopg
+    # default waits for 5 executions of a statement before preparing).
+    _connection.prepare_threshold = 0
     _connection_created_at = time.monotonic()
     logger.info("Opened psycopg connection to %s:%d/%s", host, port, dbname)
     return _connection
@@ -5,14 +5,11 @@ from __future__ import annotations
 import logging
 import os
 import threading
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
 from typing import Any
 
-import boto3
-from boto3.dynamodb.conditions import Attr, Key
-
 from bdo_common.models import Item, MergedCatalogItem
 
 logger = logging.getLogger(__name__)
@@ -28,10 +25,55 @@ _TRACKED_MARKER_ATTR = "t"
 _TRACKED_MARKER_VALUE = "1"
 
 
+_table: Any = None  # cached boto3 Table resource (untyped)
+
+
+def _new_table() -> Any:  # boto3 Table resource (untyped)
+    """Construct a Table resource sized for this module's concurrent callers.
+
+    The HTTP pool is widened past botocore's default of 10 so the segmented
+    scan and the bulk catalog writer don't serialize on sockets, keepalive
+    avoids re-handshaking across Lambda freeze/thaw gaps, and adaptive retry
+    pacing backs off client-side when the table throttles.
+    """
+    # Deferred like psycopg in bdo_common.db: modules that import this one
+    # transitively (catalog/icons helpers) shouldn't pay the boto3 import
+    # unless a table call actually happens.
+    import boto3
+    from botocore.config import Config
+
+    config = Config(
+        max_pool_connections=32,
+        tcp_keepalive=True,
+        retries={"mode": "adaptive"},
+    )
+    return boto3.resource("dynamodb", config=config).Table(_TABLE_NAME)
+
+
 def _get_table() -> Any:  # boto3 Table resource (untyped)
-    """Return the DynamoDB Table resource."""
-    dynamodb = boto3.resource("dynamodb")
-    return dynamodb.Table(_TABLE_NAME)
+    """Return the DynamoDB Table resource, constructing it once per environment.
+
+    Resource construction loads the service model and is the dominant cost of
+    a call otherwise served from a warm connection pool; cache it so only the
+    first invocation in an execution environment pays it.
+    """
+    global _table  # noqa: PLW0603
+    if _table is None:
+        _table = _new_table()
+    return _table
+
+
+def _iter_pages(
+    operation: Callable[..., dict[str, Any]], kwargs: dict[str, Any]
+) -> Iterator[list[dict[str, Any]]]:
+    """Yield raw item pages from a bound ``query``/``scan``, following
+    ``LastEvaluatedKey`` until the result set is exhausted."""
+    response = operation(**kwargs)
+    yield response.get("Items", [])
+    while "LastEvaluatedKey" in response:
+        kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        response = operation(**kwargs)
+        yield response.get("Items", [])
 
 
 def _item_to_model(raw: dict[str, Any]) -> Item:
@@ -65,47 +107,38 @@ def get_item(item_id: int) -> Item | None:
 
 def list_items(*, category: str | None = None, tracked: bool | None = None) -> list[Item]:
     """List items, optionally filtering by category and/or tracked status."""
+    from boto3.dynamodb.conditions import Attr, Key
+
     table = _get_table()
 
     if category is not None and tracked is not None:
         # Use the GSI
-        query_kwargs: dict[str, Any] = {
+        operation = table.query
+        kwargs: dict[str, Any] = {
             "IndexName": _GSI_NAME,
             "KeyConditionExpression": Key("category").eq(category)
             & Key("tracked").eq(str(tracked).lower()),
         }
-        response: dict[str, Any] = table.query(**query_kwargs)
-        items_raw: list[dict[str, Any]] = response.get("Items", [])
-        while "LastEvaluatedKey" in response:
-            query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
-            response = table.query(**query_kwargs)
-            items_raw.extend(response.get("Items", []))
     elif category is not None:
         # Query GSI with just partition key
-        query_kwargs = {
+        operation = table.query
+        kwargs = {
             "IndexName": _GSI_NAME,
             "KeyConditionExpression": Key("category").eq(category),
         }
-        response = table.query(**query_kwargs)
-        items_raw = response.get("Items", [])
-        while "LastEvaluatedKey" in response:
-            query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
-            response = table.query(**query_kwargs)
-            items_raw.extend(response.get("Items", []))
     else:
         # Scan (with optional filter)
-        scan_kwargs: dict[str, Any] = {}
+        operation = table.scan
+        kwargs = {}
         if tracked is not None:
-            scan_kwargs["FilterExpression"] = Attr("tracked").eq(str(tracked).lower())
-        response = table.scan(**scan_kwargs)
-        items_raw = response.get("Items", [])
-        # Handle pagination
-        while "LastEvaluatedKey" in response:
-            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
-            response = table.scan(**scan_kwargs)
-            items_raw.extend(response.get("Items", []))
+            kwargs["FilterExpression"] = Attr("tracked").eq(str(tracked).lower())
 
-    return [_item_to_model(raw) for raw in items_raw]
+    # Convert per page rather than buffering every raw dict first, so a large
+    # result holds one page of raw items at a time alongside the models.
+    items: list[Item] = []
+    for page in _iter_pages(operation, kwargs):
+        items.extend(_item_to_model(raw) for raw in page)
+    return items
 
 
 def put_item(item: Item) -> None:
@@ -301,7 +334,7 @@ def _thread_local_table() -> Any:
     """Return a per-thread Table resource for concurrent catalog writes."""
     table = getattr(_thread_local, "catalog_table", None)
     if table is None:
-        table = boto3.resource("dynamodb").Table(_TABLE_NAME)
+        table = _new_table()
         _thread_local.catalog_table = table
     return table
 
@@ -355,24 +388,37 @@ def _collect_fingerprints(
         out[int(raw["id"])] = (raw.get("name", ""), grade, names)
 
 
+#: Parallel segments for the full-catalog fingerprint scan. The table holds
+#: tens of thousands of rows; segmented scans are I/O-bound, so a handful of
+#: threads gives near-linear speedup without saturating table read capacity.
+_SCAN_SEGMENTS = 8
+
+
 def scan_catalog_fingerprints() -> dict[int, tuple[str, int | None, dict[str, str]]]:
     """Scan all items, projecting the fields the catalog sync diffs against.
 
     Returns ``{id: (name, grade, names)}`` for every row, so the catalog sync
-    can write only the items whose stored values differ from ``util/db``.
+    can write only the items whose stored values differ from ``util/db``. The
+    scan runs as a segmented parallel ``Scan`` (``Segment``/``TotalSegments``),
+    each worker paginating its own slice on a per-thread Table resource.
     """
-    table = _get_table()
-    scan_kwargs: dict[str, Any] = {
-        "ProjectionExpression": "id, #name, grade, #names",
-        "ExpressionAttributeNames": {"#name": "name", "#names": "names"},
-    }
+
+    def _scan_segment(segment: int) -> dict[int, tuple[str, int | None, dict[str, str]]]:
+        scan_kwargs: dict[str, Any] = {
+            "ProjectionExpression": "id, #name, grade, #names",
+            "ExpressionAttributeNames": {"#name": "name", "#names": "names"},
+            "Segment": segment,
+            "TotalSegments": _SCAN_SEGMENTS,
+        }
+        out: dict[int, tuple[str, int | None, dict[str, str]]] = {}
+        for page in _iter_pages(_thread_local_table().scan, scan_kwargs):
+            _collect_fingerprints(page, out)
+        return out
+
     fingerprints: dict[int, tuple[str, int | None, dict[str, str]]] = {}
-    response = table.scan(**scan_kwargs)
-    _collect_fingerprints(response.get("Items", []), fingerprints)
-    while "LastEvaluatedKey" in response:
-        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
-        response = table.scan(**scan_kwargs)
-        _collect_fingerprints(response.get("Items", []), fingerprints)
+    with ThreadPoolExecutor(max_workers=_SCAN_SEGMENTS) as executor:
+        for partial in executor.map(_scan_segment, range(_SCAN_SEGMENTS)):
+            fingerprints.update(partial)
     return fingerprints
 
 
@@ -394,15 +440,14 @@ def list_tracked_items() -> list[Item]:
     present only on tracked items. The read scales with the tracked subset, not
     the full catalog, so catalog growth never inflates the hourly ETL cost.
     """
+    from boto3.dynamodb.conditions import Key
+
     table = _get_table()
     query_kwargs: dict[str, Any] = {
         "IndexName": _TRACKED_GSI_NAME,
         "KeyConditionExpression": Key(_TRACKED_MARKER_ATTR).eq(_TRACKED_MARKER_VALUE),
     }
-    response: dict[str, Any] = table.query(**query_kwargs)
-    items_raw: list[dict[str, Any]] = response.get("Items", [])
-    while "LastEvaluatedKey" in response:
-        query_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
-        response = table.query(**query_kwargs)
-        items_raw.extend(response.get("Items", []))
-    return [_item_to_model(raw) for raw in items_raw]
+    items: list[Item] = []
+    for page in _iter_pages(table.query, query_kwargs):
+        items.extend(_item_to_model(raw) for raw in page)
+    return items
@@ -18,8 +18,6 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
-import boto3
-
 from bdo_common import dynamo
 from bdo_common.models import Item
 
@@ -102,7 +100,11 @@ def sync_icons(
     logged and counted as an error (its ``icon_status`` is left unchanged so the
     next run retries it) and does not abort the rest.
     """
-    s3 = s3_client if s3_client is not None else boto3.client("s3")
+    if s3_client is None:
+        import boto3  # imported here to avoid cold-start cost when a client is injected
+
+        s3_client = boto3.client("s3")
+    s3 = s3_client
     stored = missing = errors = 0
 
     for item in items:
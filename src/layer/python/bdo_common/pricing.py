@@ -12,6 +12,7 @@ go through :func:`enhancement_analysis` and never name a concrete model.
 
 from __future__ import annotations
 
+import functools
 import json
 from collections.abc import Callable, Mapping
 from dataclasses import dataclass
@@ -99,6 +100,27 @@ def load_rates(path: Path = _RATES_PATH) -> dict[str, Any]:
     return data
 
 
+@functools.lru_cache(maxsize=1)
+def _default_rates() -> dict[str, Any]:
+    """Parse the bundled ``rates.json`` once per execution environment.
+
+    The file is static reference data shipped with the layer; callers treat
+    the mapping as read-only, so re-reading it per analysis is wasted I/O.
+    """
+    return load_rates()
+
+
+@functools.lru_cache(maxsize=8)
+def _default_model(model_id: str) -> EnhancementModel:
+    """Model instance built from the bundled rates, cached per model id.
+
+    Models are immutable after construction (curves are copied into the
+    instance; accessory_cron_v1 precomputes its attempt table in ``__init__``),
+    so rebuilding one per analysis call only repeats that setup work.
+    """
+    return get_model(model_id, _default_rates())
+
+
 # --------------------------------------------------------------------------- #
 # Core math (model-agnostic helpers)
 # --------------------------------------------------------------------------- #
@@ -423,9 +445,9 @@ def enhancement_analysis(
     if intent not in ("personal", "resale"):
         raise ValueError(f"intent must be 'personal' or 'resale', got {intent!r}")
 
-    data = rates if rates is not None else load_rates()
+    data = rates if rates is not None else _default_rates()
     constants = data["constants"]
-    model = get_model(model_id, data)
+    model = get_model(model_id, data) if rates is not None else _default_model(model_id)
     tax_cfg = tax if tax is not None else TaxConfig()
     sale_rate = 1.0 if intent == "personal" else net_rate(tax_cfg, constants)
 
@@ -433,9 +455,12 @@ def enhancement_analysis(
     cumulative_cost: float | None = None
     chain_intact = True
 
+    # Every transition needs the clean (sid:0) price; check once, not per tier.
+    has_clean_price = 0 in prices
+
     for transition in model.transitions():
         sid_from, sid_to = _parse_transition(transition)
-        if 0 not in prices or sid_from not in prices or sid_to not in prices:
+        if not has_clean_price or sid_from not in prices or sid_to not in prices:
             # Missing price -> omit this transition and break the self-build
             # chain (we can no longer cost clean -> sid:N for higher tiers).
             chain_intact = False
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from datetime import UTC, date, datetime, time, timedelta
 from typing import TYPE_CHECKING, Any
 
@@ -14,6 +15,39 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _snapshot_from_row(r: tuple[Any, ...]) -> SnapshotRow:
+    """Map one market_snapshot SELECT row (canonical column order) to a model."""
+    return SnapshotRow(
+        region=r[0],
+        snapshot_at=r[1],
+        item_id=r[2],
+        sid=r[3],
+        base_price=r[4],
+        current_stock=r[5],
+        total_trades=r[6],
+        last_sold_price=r[7],
+        last_sold_at=r[8],
+    )
+
+
+def _daily_from_row(r: tuple[Any, ...]) -> DailyRow:
+    """Map one market_daily SELECT row (canonical column order) to a model."""
+    return DailyRow(
+        region=r[0],
+        trade_date=r[1],
+        item_id=r[2],
+        sid=r[3],
+        open_price=r[4],
+        high_price=r[5],
+        low_price=r[6],
+        close_price=r[7],
+        avg_price=r[8],
+        total_trades_delta=r[9],
+        avg_stock=r[10],
+        snapshot_count=r[11],
+    )
+
+
 class ItemRepo:
     """item table operations."""
 
@@ -40,6 +74,34 @@ class ItemRepo:
         """
         conn.execute(sql, (item_id, name, category, main_category, sub_category))
 
+    @staticmethod
+    def bulk_upsert(
+        conn: psycopg.Connection[tuple[Any, ...]],
+        rows: Sequence[tuple[int, str, str | None, str | None, str | None]],
+    ) -> int:
+        """Batch upsert item rows. Returns count of rows attempted.
+
+        ``rows`` are ``(item_id, name, category, main_category, sub_category)``
+        tuples. One ``executemany`` replaces a round-trip per item: psycopg3
+        pipelines the batch, so the ETL pays network latency once per batch
+        instead of once per row.
+        """
+        if not rows:
+            return 0
+        sql = """
+            INSERT INTO item (id, name, category, main_category, sub_category, updated_at)
+            VALUES (%s, %s, %s, %s, %s, NOW())
+            ON CONFLICT (id) DO UPDATE SET
+                name = EXCLUDED.name,
+                category = EXCLUDED.category,
+                main_category = EXCLUDED.main_category,
+                sub_category = EXCLUDED.sub_category,
+                updated_at = NOW()
+        """
+        cur = conn.cursor()
+        cur.executemany(sql, rows)
+        return len(rows)
+
 
 class ItemSidRepo:
     """item_sid table operations."""
@@ -68,6 +130,33 @@ class ItemSidRepo:
         """
         conn.execute(sql, (region, item_id, sid, max_enhance, price_min, price_max))
 
+    @staticmethod
+    def bulk_upsert(
+        conn: psycopg.Connection[tuple[Any, ...]],
+        rows: Sequence[tuple[str, int, int, int, int, int]],
+    ) -> int:
+        """Batch upsert item_sid rows. Returns count of rows attempted.
+
+        ``rows`` are ``(region, item_id, sid, max_enhance, price_min,
+        price_max)`` tuples; same one-round-trip rationale as
+        :meth:`ItemRepo.bulk_upsert`.
+        """
+        if not rows:
+            return 0
+        sql = """
+            INSERT INTO item_sid
+                (region, item_id, sid, max_enhance, price_min, price_max, updated_at)
+            VALUES (%s, %s, %s, %s, %s, %s, NOW())
+            ON CONFLICT (region, item_id, sid) DO UPDATE SET
+                max_enhance = EXCLUDED.max_enhance,
+                price_min = EXCLUDED.price_min,
+                price_max = EXCLUDED.price_max,
+                updated_at = NOW()
+        """
+        cur = conn.cursor()
+        cur.executemany(sql, rows)
+        return len(rows)
+
 
 class SnapshotRepo:
     """market_snapshot table operations."""
@@ -93,7 +182,9 @@ class SnapshotRepo:
             VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
             ON CONFLICT (region, item_id, sid, snapshot_at) DO NOTHING
         """
-        params = [
+        # Generator, not a list: executemany consumes the tuples as it streams
+        # batches, so the models are never duplicated as a second full list.
+        params = (
             (
                 r.region,
                 r.snapshot_at,
@@ -106,7 +197,7 @@ class SnapshotRepo:
                 r.last_sold_at,
             )
             for r in rows
-        ]
+        )
         cur = conn.cursor()
         cur.executemany(sql, params)
         return len(rows)
@@ -147,20 +238,29 @@ class SnapshotRepo:
             LIMIT %s
         """  # nosec B608 - conditions are fixed fragments; all values are %s params
         rows = conn.execute(sql, params).fetchall()
-        return [
-            SnapshotRow(
-                region=r[0],
-                snapshot_at=r[1],
-                item_id=r[2],
-                sid=r[3],
-                base_price=r[4],
-                current_stock=r[5],
-                total_trades=r[6],
-                last_sold_price=r[7],
-                last_sold_at=r[8],
-            )
-            for r in rows
-        ]
+        return [_snapshot_from_row(r) for r in rows]
+
+    @staticmethod
+    def latest_prices_by_sid(
+        conn: psycopg.Connection[tuple[Any, ...]],
+        *,
+        region: str,
+        item_id: int,
+    ) -> dict[int, int]:
+        """Latest ``base_price`` per sid for one item, as a ``{sid: price}`` map.
+
+        One ``DISTINCT ON (sid)`` scan replaces fetching a window of snapshot
+        rows and reducing them client-side: the enhancement ladder needs only
+        the newest price per tier, so the per-row work stays in the database.
+        """
+        sql = """
+            SELECT DISTINCT ON (sid) sid, base_price
+            FROM market_snapshot
+            WHERE region = %s AND item_id = %s
+            ORDER BY sid, snapshot_at DESC
+        """
+        rows = conn.execute(sql, (region, item_id)).fetchall()
+        return {r[0]: r[1] for r in rows}
 
     @staticmethod
     def get_latest(
@@ -181,20 +281,7 @@ class SnapshotRepo:
             LIMIT %s
         """
         rows = conn.execute(sql, (region, item_id, sid, limit)).fetchall()
-        return [
-            SnapshotRow(
-                region=r[0],
-                snapshot_at=r[1],
-                item_id=r[2],
-                sid=r[3],
-                base_price=r[4],
-                current_stock=r[5],
-                total_trades=r[6],
-                last_sold_price=r[7],
-                last_sold_at=r[8],
-            )
-            for r in rows
-        ]
+        return [_snapshot_from_row(r) for r in rows]
 
     @staticmethod
     def purge_older_than(
@@ -346,23 +433,7 @@ class DailyRepo:
             ORDER BY trade_date DESC
         """  # nosec B608 - conditions are fixed fragments; all values are %s params
         rows = conn.execute(sql, params).fetchall()
-        return [
-            DailyRow(
-                region=r[0],
-                trade_date=r[1],
-                item_id=r[2],
-                sid=r[3],
-                open_price=r[4],
-                high_price=r[5],
-                low_price=r[6],
-                close_price=r[7],
-                avg_price=r[8],
-                total_trades_delta=r[9],
-                avg_stock=r[10],
-                snapshot_count=r[11],
-            )
-            for r in rows
-        ]
+        return [_daily_from_row(r) for r in rows]
 
     @staticmethod
     def get_daily_window(
@@ -384,20 +455,4 @@ class DailyRepo:
             LIMIT %s
         """
         rows = conn.execute(sql, (region, item_id, sid, window_days)).fetchall()
-        return [
-            DailyRow(
-                region=r[0],
-                trade_date=r[1],
-                item_id=r[2],
-                sid=r[3],
-                open_price=r[4],
-                high_price=r[5],
-                low_price=r[6],
-                close_price=r[7],
-                avg_price=r[8],
-                total_trades_delta=r[9],
-                avg_stock=r[10],
-                snapshot_count=r[11],
-            )
-            for r in rows
-        ]
+        return [_daily_from_row(r) for r in rows]
@@ -0,0 +1,100 @@
+"""Tests for bdo_common.db warm-start connection reuse (mocked psycopg.connect)."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock
+
+import psycopg
+import pytest
+
+import bdo_common.config
+import bdo_common.db as db
+
+
+@pytest.fixture(autouse=True)
+def _reset_db_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fresh module state + settings per test; never touch a real database."""
+    bdo_common.config.get_settings.cache_clear()
+    monkeypatch.setattr(db, "_connection", None)
+    monkeypatch.setattr(db, "_connection_created_at", 0.0)
+
+
+def _fake_connect(monkeypatch: pytest.MonkeyPatch) -> tuple[MagicMock, list[MagicMock]]:
+    """Patch psycopg.connect; return the patch plus the mocks it produced.
+
+    db.get_connection imports psycopg lazily, so patch the real module. Tests
+    drive ``closed`` / assert ``close`` through the returned mock list rather
+    than through get_connection's return value, which is typed as a real
+    psycopg Connection.
+    """
+    created: list[MagicMock] = []
+
+    def _factory(*args: Any, **kwargs: Any) -> MagicMock:
+        conn = MagicMock(closed=False)
+        created.append(conn)
+        return conn
+
+    connect = MagicMock(side_effect=_factory)
+    monkeypatch.setattr(psycopg, "connect", connect)
+    return connect, created
+
+
+class TestGetConnection:
+    """Warm-start reuse semantics of the module-global connection."""
+
+    def test_reuses_open_connection_across_calls(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        connect, _ = _fake_connect(monkeypatch)
+        first = db.get_connection()
+        second = db.get_connection()
+        assert first is second
+        connect.assert_called_once()
+
+    def test_reconnects_when_connection_closed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        connect, created = _fake_connect(monkeypatch)
+        first = db.get_connection()
+        created[0].closed = True
+        second = db.get_connection()
+        assert second is not first
+        assert connect.call_count == 2
+
+    def test_iam_reconnects_after_token_ttl(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("USE_IAM_AUTH", "true")
+        monkeypatch.setattr(db, "_generate_iam_token", lambda *a, **kw: "token")
+        connect, created = _fake_connect(monkeypatch)
+
+        first = db.get_connection()
+        # Age the connection past the 12-minute proactive-reconnect threshold.
+        monkeypatch.setattr(
+            db, "_connection_created_at", db._connection_created_at - db._IAM_TOKEN_TTL_SECONDS
+        )
+        second = db.get_connection()
+
+        assert second is not first
+        created[0].close.assert_called_once()
+        assert connect.call_count == 2
+
+    def test_non_iam_connection_never_expires(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("USE_IAM_AUTH", raising=False)
+        connect, _ = _fake_connect(monkeypatch)
+
+        db.get_connection()
+        monkeypatch.setattr(
+            db, "_connection_created_at", db._connection_created_at - db._IAM_TOKEN_TTL_SECONDS
+        )
+        db.get_connection()
+
+        connect.assert_called_once()
+
+
+class TestCloseConnection:
+    """close_connection clears the module state."""
+
+    def test_close_then_reconnect(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        connect, created = _fake_connect(monkeypatch)
+        first = db.get_connection()
+        db.close_connection()
+        created[0].close.assert_called_once()
+        second = db.get_connection()
+        assert second is not first
+        assert connect.call_count == 2
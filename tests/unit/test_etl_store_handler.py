@@ -58,16 +58,20 @@ class TestStoreData:
         conn = MagicMock()
         monkeypatch.setattr(mod.db, "get_connection", lambda: conn)
 
-        item_calls: list[dict[str, Any]] = []
-        sid_calls: list[dict[str, Any]] = []
+        item_rows: list[Any] = []
+        sid_rows: list[Any] = []
         bulk_rows: list[Any] = []
 
-        monkeypatch.setattr(
-            mod.ItemRepo, "upsert", staticmethod(lambda c, **kw: item_calls.append(kw))
-        )
-        monkeypatch.setattr(
-            mod.ItemSidRepo, "upsert", staticmethod(lambda c, **kw: sid_calls.append(kw))
-        )
+        def fake_item_bulk(c: Any, rows: list[Any]) -> int:
+            item_rows.extend(rows)
+            return len(rows)
+
+        def fake_sid_bulk(c: Any, rows: list[Any]) -> int:
+            sid_rows.extend(rows)
+            return len(rows)
+
+        monkeypatch.setattr(mod.ItemRepo, "bulk_upsert", staticmethod(fake_item_bulk))
+        monkeypatch.setattr(mod.ItemSidRepo, "bulk_upsert", staticmethod(fake_sid_bulk))
 
         def fake_bulk(c: Any, rows: list[Any]) -> int:
             bulk_rows.extend(rows)
@@ -77,11 +81,9 @@ class TestStoreData:
 
         result = mod.handler(_event(), lambda_context)
 
-        assert len(item_calls) == 1
-        assert item_calls[0]["item_id"] == 11608
-        assert item_calls[0]["category"] == "necklace"
-        assert len(sid_calls) == 2
-        assert sid_calls[0]["price_max"] == 9999
+        assert item_rows == [(11608, "Deboreka Necklace", "necklace", None, None)]
+        assert len(sid_rows) == 2
+        assert sid_rows[0] == ("tw", 11608, 0, 5, 1, 9999)
         assert len(bulk_rows) == 2
         assert bulk_rows[0].region == "tw"
         assert bulk_rows[0].snapshot_at == datetime(2026, 6, 1, 5, 0, tzinfo=UTC)
@@ -103,13 +105,14 @@ class TestStoreData:
         mod = load_handler("store_data")
         conn = MagicMock()
         monkeypatch.setattr(mod.db, "get_connection", lambda: conn)
-        monkeypatch.setattr(mod.ItemRepo, "upsert", staticmethod(lambda c, **kw: None))
+        monkeypatch.setattr(mod.ItemRepo, "bulk_upsert", staticmethod(lambda c, rows: len(rows)))
         sid_ids: list[int] = []
-        monkeypatch.setattr(
-            mod.ItemSidRepo,
-            "upsert",
-            staticmethod(lambda c, **kw: sid_ids.append(kw["item_id"])),
-        )
+
+        def fake_sid_bulk(c: Any, rows: list[Any]) -> int:
+            sid_ids.extend(row[1] for row in rows)
+            return len(rows)
+
+        monkeypatch.setattr(mod.ItemSidRepo, "bulk_upsert", staticmethod(fake_sid_bulk))
         monkeypatch.setattr(
             mod.SnapshotRepo, "bulk_insert", staticmethod(lambda c, rows: len(rows))
         )
@@ -130,8 +133,10 @@ class TestStoreData:
         mod = load_handler("store_data")
         conn = MagicMock()
         monkeypatch.setattr(mod.db, "get_connection", lambda: conn)
-        monkeypatch.setattr(mod.ItemRepo, "upsert", staticmethod(lambda c, **kw: None))
-        monkeypatch.setattr(mod.ItemSidRepo, "upsert", staticmethod(lambda c, **kw: None))
+        monkeypatch.setattr(mod.ItemRepo, "bulk_upsert", staticmethod(lambda c, rows: len(rows)))
+        monkeypatch.setattr(
+            mod.ItemSidRepo, "bulk_upsert", staticmethod(lambda c, rows: len(rows))
+        )
 
         def boom(c: Any, rows: list[Any]) -> int:
             raise RuntimeError("insert failed")
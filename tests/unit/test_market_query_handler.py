@@ -122,15 +122,15 @@ def test_daily_returns_rows(
 def test_analysis_combines_pricing_and_analytics(
     mod: ModuleType, lambda_context: Any, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    ladder = [
-        _snap(0, 453_000_000),
-        _snap(1, 1_170_000_000),
-        _snap(2, 3_540_000_000),
-        _snap(3, 9_450_000_000),
-        _snap(4, 28_700_000_000),
-        _snap(5, 186_000_000_000),
-    ]
-    monkeypatch.setattr(mod.SnapshotRepo, "get_snapshots", lambda conn, **kw: ladder)
+    ladder = {
+        0: 453_000_000,
+        1: 1_170_000_000,
+        2: 3_540_000_000,
+        3: 9_450_000_000,
+        4: 28_700_000_000,
+        5: 186_000_000_000,
+    }
+    monkeypatch.setattr(mod.SnapshotRepo, "latest_prices_by_sid", lambda conn, **kw: ladder)
     monkeypatch.setattr(
         mod.DailyRepo, "get_daily_window", lambda conn, **kw: [_daily(i) for i in range(7)]
     )
@@ -150,7 +150,7 @@ def test_analysis_insufficient_daily_data(
     mod: ModuleType, lambda_context: Any, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     monkeypatch.setattr(
-        mod.SnapshotRepo, "get_snapshots", lambda conn, **kw: [_snap(0, 453_000_000)]
+        mod.SnapshotRepo, "latest_prices_by_sid", lambda conn, **kw: {0: 453_000_000}
     )
     monkeypatch.setattr(
         mod.DailyRepo, "get_daily_window", lambda conn, **kw: [_daily(0), _daily(1)]
@@ -274,6 +274,40 @@ def test_insights_returns_404_when_no_summary(
     assert body["message"] == "No summary found"
 
 
+def test_insights_explicit_date_served_from_cache(
+    mod: ModuleType, lambda_context: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = {"n": 0}
+
+    def fake(conn: Any, **kw: Any) -> Any:
+        calls["n"] += 1
+        return _market_summary()
+
+    monkeypatch.setattr(mod.SummaryRepo, "get", staticmethod(fake))
+    event = _event("/v1/insights", query={"region": "tw", "date": "2026-06-13"})
+    first = mod.handler(event, lambda_context)
+    second = mod.handler(event, lambda_context)
+    assert first["statusCode"] == 200
+    assert second["body"] == first["body"]
+    assert calls["n"] == 1  # second request never hit the repo
+
+
+def test_insights_latest_is_never_cached(
+    mod: ModuleType, lambda_context: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = {"n": 0}
+
+    def fake(conn: Any, **kw: Any) -> Any:
+        calls["n"] += 1
+        return _market_summary()
+
+    monkeypatch.setattr(mod.SummaryRepo, "get", staticmethod(fake))
+    event = _event("/v1/insights", query={"region": "tw"})
+    mod.handler(event, lambda_context)
+    mod.handler(event, lambda_context)
+    assert calls["n"] == 2
+
+
 def test_insights_rejects_invalid_region(
     mod: ModuleType, lambda_context: Any, monkeypatch: pytest.MonkeyPatch
 ) -> None:
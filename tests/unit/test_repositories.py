@@ -53,6 +53,22 @@ class TestItemRepo:
         sql, params = mock_conn.execute.call_args[0]
         assert params == (100, "Test Item", None, None, None)
 
+    def test_bulk_upsert_empty_returns_zero(self, mock_conn: MagicMock) -> None:
+        assert ItemRepo.bulk_upsert(mock_conn, []) == 0
+        mock_conn.cursor.assert_not_called()
+
+    def test_bulk_upsert_calls_executemany(self, mock_conn: MagicMock) -> None:
+        rows = [
+            (11608, "Deboreka Necklace", "necklace", None, None),
+            (11629, "Deboreka Ring", "ring", None, None),
+        ]
+        assert ItemRepo.bulk_upsert(mock_conn, rows) == 2
+        cursor = mock_conn.cursor.return_value
+        cursor.executemany.assert_called_once()
+        sql, params_list = cursor.executemany.call_args[0]
+        assert "ON CONFLICT" in sql
+        assert params_list == rows
+
 
 # ---------------------------------------------------------------------------
 # ItemSidRepo
@@ -78,6 +94,18 @@ class TestItemSidRepo:
         assert "%s" in sql
         assert params == ("tw", 11608, 2, 5, 100_000_000, 5_000_000_000)
 
+    def test_bulk_upsert_calls_executemany(self, mock_conn: MagicMock) -> None:
+        rows = [
+            ("tw", 11608, 0, 5, 1, 9999),
+            ("tw", 11608, 1, 5, 1, 9999),
+        ]
+        assert ItemSidRepo.bulk_upsert(mock_conn, rows) == 2
+        cursor = mock_conn.cursor.return_value
+        cursor.executemany.assert_called_once()
+        sql, params_list = cursor.executemany.call_args[0]
+        assert "ON CONFLICT" in sql
+        assert params_list == rows
+
 
 # ---------------------------------------------------------------------------
 # SnapshotRepo
@@ -122,13 +150,28 @@ class TestSnapshotRepo:
         assert result == 2
         cursor = mock_conn.cursor.return_value
         cursor.executemany.assert_called_once()
-        sql, params_list = cursor.executemany.call_args[0]
+        sql, params_iter = cursor.executemany.call_args[0]
         assert "ON CONFLICT" in sql
         assert "%s" in sql
+        params_list = list(params_iter)  # bulk_insert passes a generator
         assert len(params_list) == 2
         # Verify first row tuple
         assert params_list[0] == ("tw", ts, 11608, 0, 448_000_000, 100, 5000, 445_000_000, ts)
 
+    def test_latest_prices_by_sid_returns_map(self, mock_conn: MagicMock) -> None:
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = [
+            (0, 448_000_000),
+            (1, 1_170_000_000),
+        ]
+        mock_conn.execute.return_value = mock_result
+
+        ladder = SnapshotRepo.latest_prices_by_sid(mock_conn, region="tw", item_id=11608)
+        assert ladder == {0: 448_000_000, 1: 1_170_000_000}
+        sql, params = mock_conn.execute.call_args[0]
+        assert "DISTINCT ON (sid)" in sql
+        assert params == ("tw", 11608)
+
     def test_get_snapshots_returns_models(self, mock_conn: MagicMock) -> None:
         ts = datetime(2024, 5, 30, 8, 0, 0, tzinfo=UTC)
         mock_result = MagicMock()